@@ -16,8 +16,55 @@ from qgis.core import (QgsProject, QgsLayoutExporter, QgsLayoutItemMap,
 from qgis.gui import QgsColorButton, QgsFontButton
 
 import os
+from dataclasses import dataclass
+from typing import NamedTuple
 from ..utils import get_arcadia_setting, set_arcadia_setting
 
+# Named colors reused for widget defaults instead of re-parsing the names
+_COLOR = {name: QColor(name) for name in ('white', 'black')}
+
+# (anchor right, anchor bottom) for each entry of the position combo:
+# Top Left, Top Right, Bottom Left, Bottom Right, Custom
+_POSITION_TABLE = (
+    (False, False),
+    (True, False),
+    (False, True),
+    (True, True),
+    (False, False),
+)
+
+
+class LegendItem(NamedTuple):
+    """Single entry drawn by the legend overlay"""
+    name: str
+    type: str = 'layer'
+
+
+@dataclass(frozen=True)
+class LegendSettings:
+    """Immutable snapshot of the legend configuration taken from the dialog"""
+    
+    position: str
+    x_offset: int
+    y_offset: int
+    width: int
+    height: int
+    auto_size: bool
+    show_background: bool
+    background_color: str
+    background_alpha: int
+    show_frame: bool
+    frame_color: str
+    frame_width: int
+    show_title: bool
+    title_text: str
+    
+    def content_key(self):
+        """Return the values that change the overlay content, not its geometry"""
+        return (self.show_background, self.background_color, self.background_alpha,
+                self.show_frame, self.frame_color, self.frame_width,
+                self.show_title, self.title_text)
+
 
 class CanvasLegendOverlay(QWidget):
     """Widget for displaying legend overlay on canvas"""
@@ -28,14 +75,23 @@ class CanvasLegendOverlay(QWidget):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.legend_items = []
-        self.settings = {}
+        self.settings = None
+        self.background_color = QColor(_COLOR['white'])
+        self.frame_color = QColor(_COLOR['black'])
         
     def update_legend_content(self, legend_items, settings):
         """Update legend content and settings"""
         self.legend_items = legend_items
         self.settings = settings
+        self.update_colors()
         self.update()
         
+    def update_colors(self):
+        """Resolve background and frame colors once per settings change"""
+        self.background_color = QColor(self.settings.background_color)
+        self.background_color.setAlpha(self.settings.background_alpha)
+        self.frame_color = QColor(self.settings.frame_color)
+        
     def paintEvent(self, event):
         """Paint the legend overlay"""
         if not self.legend_items:
@@ -45,16 +101,13 @@ class CanvasLegendOverlay(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw background if enabled
-        if self.settings.get('show_background', True):
-            bg_color = QColor(self.settings.get('background_color', 'white'))
-            bg_color.setAlpha(self.settings.get('background_alpha', 200))
-            painter.fillRect(self.rect(), bg_color)
+        if self.settings.show_background:
+            painter.fillRect(self.rect(), self.background_color)
             
         # Draw frame if enabled
-        if self.settings.get('show_frame', True):
-            frame_color = QColor(self.settings.get('frame_color', 'black'))
-            frame_width = self.settings.get('frame_width', 1)
-            painter.setPen(frame_color)
+        if self.settings.show_frame:
+            frame_width = self.settings.frame_width
+            painter.setPen(self.frame_color)
             painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
             
         # Draw legend items
@@ -66,7 +119,7 @@ class CanvasLegendOverlay(QWidget):
     def draw_legend_item(self, painter, item, y_offset):
         """Draw individual legend item"""
         # Simple implementation - would be expanded for real use
-        painter.drawText(10, y_offset, item.get('name', 'Unknown'))
+        painter.drawText(10, y_offset, item.name)
 
 
 class CanvasLegendDialog(QDialog):
@@ -78,8 +131,23 @@ class CanvasLegendDialog(QDialog):
         self.canvas = iface.mapCanvas()
         self.legend_overlay = None
         
+        # Legend items are rebuilt only after the layer tree changes
+        self._legend_items = None
+        self._applied_content_key = None
+        
+        # Index of the selected position combo entry, see _POSITION_TABLE
+        self._position_index = 0
+        
+        # Settings are written once the user stops interacting
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.setTimerType(Qt.CoarseTimer)
+        self._save_timer.timeout.connect(self._flush_settings)
+        
         self.setupUi()
         self.load_settings()
+        self._position_index = self.position_combo.currentIndex()
         self.connect_signals()
         
     def setupUi(self):
@@ -193,7 +261,7 @@ class CanvasLegendDialog(QDialog):
         
         bg_layout.addWidget(QLabel(self.tr('Background Color:')), 1, 0)
         self.bg_color_btn = QgsColorButton()
-        self.bg_color_btn.setColor(QColor('white'))
+        self.bg_color_btn.setColor(_COLOR['white'])
         bg_layout.addWidget(self.bg_color_btn, 1, 1)
         
         bg_layout.addWidget(QLabel(self.tr('Opacity:')), 2, 0)
@@ -214,7 +282,7 @@ class CanvasLegendDialog(QDialog):
         
         frame_layout.addWidget(QLabel(self.tr('Frame Color:')), 1, 0)
         self.frame_color_btn = QgsColorButton()
-        self.frame_color_btn.setColor(QColor('black'))
+        self.frame_color_btn.setColor(_COLOR['black'])
         frame_layout.addWidget(self.frame_color_btn, 1, 1)
         
         frame_layout.addWidget(QLabel(self.tr('Frame Width:')), 2, 0)
@@ -304,6 +372,37 @@ class CanvasLegendDialog(QDialog):
         self.export_png_btn.clicked.connect(self.export_to_png)
         self.create_composition_btn.clicked.connect(self.create_composition)
         
+        self.position_combo.currentIndexChanged.connect(self.on_position_changed)
+        
+        # Invalidate cached legend items whenever the layer tree changes
+        # (tracked so cleanup can disconnect them from the project)
+        root = QgsProject.instance().layerTreeRoot()
+        self._connections = [
+            (root.visibilityChanged, self.invalidate_legend_items),
+            (root.nameChanged, self.invalidate_legend_items),
+            (root.addedChildren, self.invalidate_legend_items),
+            (root.removedChildren, self.invalidate_legend_items),
+        ]
+        for signal, slot in self._connections:
+            signal.connect(slot)
+        
+    def cleanup(self):
+        """Disconnect the project signals connected by this dialog"""
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError) as e:
+                print(f"Error disconnecting signal: {e}")
+        self._connections = []
+        
+    def on_position_changed(self, index):
+        """Cache the selected position so positioning skips text parsing"""
+        self._position_index = index
+        
+    def invalidate_legend_items(self, *args):
+        """Mark cached legend items as stale after a layer tree change"""
+        self._legend_items = None
+        
     def tr(self, message):
         """Get the translation for a string using Qt translation API."""
         from qgis.PyQt.QtCore import QCoreApplication
@@ -319,6 +418,10 @@ class CanvasLegendDialog(QDialog):
             print(f"Error loading settings: {e}")
             
     def save_settings(self):
+        """Schedule saving current settings to Arcadia Suite configuration"""
+        self._save_timer.start()
+        
+    def _flush_settings(self):
         """Save current settings to Arcadia Suite configuration"""
         try:
             position = self.position_combo.currentText().lower().replace(' ', '_')
@@ -341,15 +444,22 @@ class CanvasLegendDialog(QDialog):
             # Create or update legend overlay
             if not self.legend_overlay:
                 self.legend_overlay = CanvasLegendOverlay(self.canvas)
+                self._applied_content_key = None
                 
             # Get current settings
             settings = self.get_current_settings()
             
-            # Get legend items from current layers
-            legend_items = self.get_legend_items()
+            # Get legend items from current layers if the layer tree changed
+            items_changed = self._legend_items is None
+            if items_changed:
+                self._legend_items = self.get_legend_items()
             
-            # Update overlay
-            self.legend_overlay.update_legend_content(legend_items, settings)
+            # Update overlay only when its content or style changed,
+            # position and size changes just move it
+            content_key = settings.content_key()
+            if items_changed or content_key != self._applied_content_key:
+                self.legend_overlay.update_legend_content(self._legend_items, settings)
+                self._applied_content_key = content_key
             
             # Position overlay
             self.position_overlay()
@@ -365,34 +475,30 @@ class CanvasLegendDialog(QDialog):
             
     def get_current_settings(self):
         """Get current settings from UI"""
-        return {
-            'position': self.position_combo.currentText(),
-            'x_offset': self.x_offset_spin.value(),
-            'y_offset': self.y_offset_spin.value(),
-            'width': self.width_spin.value(),
-            'height': self.height_spin.value(),
-            'auto_size': self.auto_size_check.isChecked(),
-            'show_background': self.show_bg_check.isChecked(),
-            'background_color': self.bg_color_btn.color().name(),
-            'background_alpha': self.bg_opacity_slider.value(),
-            'show_frame': self.show_frame_check.isChecked(),
-            'frame_color': self.frame_color_btn.color().name(),
-            'frame_width': self.frame_width_spin.value(),
-            'show_title': self.show_title_check.isChecked(),
-            'title_text': self.title_text.text()
-        }
+        return LegendSettings(
+            position=self.position_combo.currentText(),
+            x_offset=self.x_offset_spin.value(),
+            y_offset=self.y_offset_spin.value(),
+            width=self.width_spin.value(),
+            height=self.height_spin.value(),
+            auto_size=self.auto_size_check.isChecked(),
+            show_background=self.show_bg_check.isChecked(),
+            background_color=self.bg_color_btn.color().name(),
+            background_alpha=self.bg_opacity_slider.value(),
+            show_frame=self.show_frame_check.isChecked(),
+            frame_color=self.frame_color_btn.color().name(),
+            frame_width=self.frame_width_spin.value(),
+            show_title=self.show_title_check.isChecked(),
+            title_text=self.title_text.text()
+        )
         
     def get_legend_items(self):
         """Get legend items from current map layers"""
         items = []
         try:
             layers = QgsProject.instance().layerTreeRoot().children()
-            for layer_node in layers:
-                if layer_node.isVisible():
-                    items.append({
-                        'name': layer_node.name(),
-                        'type': 'layer'
-                    })
+            items = [LegendItem(layer_node.name())
+                     for layer_node in layers if layer_node.isVisible()]
         except Exception as e:
             print(f"Error getting legend items: {e}")
         return items
@@ -406,24 +512,18 @@ class CanvasLegendDialog(QDialog):
         self.legend_overlay.resize(self.width_spin.value(), self.height_spin.value())
         overlay_size = self.legend_overlay.size()
         
-        position = self.position_combo.currentText().lower()
         x_offset = self.x_offset_spin.value()
         y_offset = self.y_offset_spin.value()
         
-        if 'top' in position and 'left' in position:
-            x, y = x_offset, y_offset
-        elif 'top' in position and 'right' in position:
-            x = canvas_size.width() - overlay_size.width() - x_offset
-            y = y_offset
-        elif 'bottom' in position and 'left' in position:
-            x = x_offset
-            y = canvas_size.height() - overlay_size.height() - y_offset
-        elif 'bottom' in position and 'right' in position:
-            x = canvas_size.width() - overlay_size.width() - x_offset
-            y = canvas_size.height() - overlay_size.height() - y_offset
-        else:  # Custom position
-            x, y = x_offset, y_offset
+        # Custom position (and no selection) uses the offsets as-is
+        if 0 <= self._position_index < len(_POSITION_TABLE):
+            right, bottom = _POSITION_TABLE[self._position_index]
+        else:
+            right, bottom = False, False
             
+        x = canvas_size.width() - overlay_size.width() - x_offset if right else x_offset
+        y = canvas_size.height() - overlay_size.height() - y_offset if bottom else y_offset
+        
         self.legend_overlay.move(x, y)
         
     def export_current_view(self):
@@ -505,6 +605,9 @@ class CanvasLegendDialog(QDialog):
         
     def closeEvent(self, event):
         """Handle dialog close event"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_settings()
         if self.legend_overlay:
             self.legend_overlay.close()
         event.accept()
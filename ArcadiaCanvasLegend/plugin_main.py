@@ -9,10 +9,12 @@ from qgis.PyQt.QtWidgets import QAction, QMenu
 from qgis.core import QgsProcessingAlgorithm, QgsApplication
 import os.path
 
-from .dialogs.canvas_legend_dialog import CanvasLegendDialog
 from .tools.canvas_legend_processor import CanvasLegendProvider
 from .utils import get_settings_file_path
 
+# Translation files shipped with the plugin
+_I18N_DIR = os.path.join(os.path.dirname(__file__), 'i18n')
+
 
 class ArcadiaCanvasLegendPlugin:
     """QGIS Plugin Implementation for Arcadia Canvas Legend."""
@@ -31,17 +33,17 @@ class ArcadiaCanvasLegendPlugin:
         # initialize plugin directory
         self.plugin_dir = os.path.dirname(__file__)
         
-        # initialize locale
-        locale = QSettings().value('locale/userLocale')[0:2]
-        locale_path = os.path.join(
-            self.plugin_dir,
-            'i18n',
-            'ArcadiaCanvasLegend_{}.qm'.format(locale))
-
-        if os.path.exists(locale_path):
-            self.translator = QTranslator()
-            self.translator.load(locale_path)
-            QCoreApplication.installTranslator(self.translator)
+        # initialize locale, English needs no translator
+        locale = (QSettings().value('locale/userLocale') or 'en')[0:2]
+        if locale != 'en':
+            locale_path = os.path.join(
+                _I18N_DIR,
+                'ArcadiaCanvasLegend_{}.qm'.format(locale))
+
+            if os.path.exists(locale_path):
+                self.translator = QTranslator()
+                self.translator.load(locale_path)
+                QCoreApplication.installTranslator(self.translator)
 
         # Declare instance attributes
         self.actions = []
@@ -109,6 +111,9 @@ class ArcadiaCanvasLegendPlugin:
             whats_this=self.tr('Opens the Canvas Legend configuration dialog')
         )
         
+        # Actions are fixed once the GUI is built
+        self.actions = tuple(self.actions)
+        
         # Initialize the processing provider
         self.initProcessing()
 
@@ -129,12 +134,13 @@ class ArcadiaCanvasLegendPlugin:
             
         for action in self.actions:
             self.iface.removePluginMenu(
-                self.tr('&Arcadia Suite'),
+                self.menu,
                 action)
             self.iface.removeToolBarIcon(action)
             
         # Clean up dialog references
         if self.canvas_legend_dialog:
+            self.canvas_legend_dialog.cleanup()
             self.canvas_legend_dialog.close()
             self.canvas_legend_dialog = None
 
@@ -143,6 +149,8 @@ class ArcadiaCanvasLegendPlugin:
         try:
             # Create dialog if it doesn't exist
             if not self.canvas_legend_dialog:
+                # Imported on first use to keep QGIS startup light
+                from .dialogs.canvas_legend_dialog import CanvasLegendDialog
                 self.canvas_legend_dialog = CanvasLegendDialog(self.iface)
                 
             # Show the dialog
@@ -6,12 +6,39 @@ Provides processing tools for batch operations and automation
 from qgis.core import (QgsProcessingProvider, QgsProcessingAlgorithm,
                       QgsProcessingParameterBoolean, QgsProcessingParameterString,
                       QgsProcessingParameterNumber, QgsProcessingParameterFile,
+                      QgsProcessingParameterFileDestination,
                       QgsProcessingOutputString, QgsProcessingException,
                       QgsProject, QgsApplication)
-from qgis.PyQt.QtCore import QCoreApplication
+from qgis.PyQt.QtCore import QCoreApplication, QT_TRANSLATE_NOOP
 from qgis.PyQt.QtGui import QIcon
 import os
 
+# Translated parameter descriptions, keyed by algorithm class
+_DESCRIPTIONS = {}
+
+
+def get_parameter_descriptions(algorithm):
+    """
+    Translate an algorithm's parameter descriptions once per class
+    
+    PARAMETER_TEXTS values are marked with QT_TRANSLATE_NOOP in the
+    'Processing' context so pylupdate extracts them, and are translated
+    here through the algorithm's tr()
+    
+    Args:
+        algorithm (QgsProcessingAlgorithm): Algorithm declaring PARAMETER_TEXTS
+        
+    Returns:
+        dict: Translated description for each parameter name
+    """
+    algorithm_class = type(algorithm)
+    descriptions = _DESCRIPTIONS.get(algorithm_class)
+    if descriptions is None:
+        descriptions = {name: algorithm.tr(text)
+                        for name, text in algorithm_class.PARAMETER_TEXTS.items()}
+        _DESCRIPTIONS[algorithm_class] = descriptions
+    return descriptions
+
 
 class CanvasLegendProvider(QgsProcessingProvider):
     """Processing provider for Canvas Legend algorithms"""
@@ -50,6 +77,14 @@ class ExportCanvasWithLegendAlgorithm(QgsProcessingAlgorithm):
     BACKGROUND_COLOR = 'BACKGROUND_COLOR'
     EXPORT_FORMAT = 'EXPORT_FORMAT'
 
+    PARAMETER_TEXTS = {
+        OUTPUT_FILE: QT_TRANSLATE_NOOP('Processing', 'Output file'),
+        LEGEND_POSITION: QT_TRANSLATE_NOOP('Processing', 'Legend position'),
+        INCLUDE_FRAME: QT_TRANSLATE_NOOP('Processing', 'Include frame around legend'),
+        BACKGROUND_COLOR: QT_TRANSLATE_NOOP('Processing', 'Legend background color'),
+        EXPORT_FORMAT: QT_TRANSLATE_NOOP('Processing', 'Export format')
+    }
+
     def tr(self, string):
         return QCoreApplication.translate('Processing', string)
 
@@ -73,12 +108,12 @@ class ExportCanvasWithLegendAlgorithm(QgsProcessingAlgorithm):
 
     def initAlgorithm(self, config=None):
         """Initialize algorithm parameters"""
+        descriptions = get_parameter_descriptions(self)
         
         self.addParameter(
-            QgsProcessingParameterFile(
+            QgsProcessingParameterFileDestination(
                 self.OUTPUT_FILE,
-                self.tr('Output file'),
-                behavior=QgsProcessingParameterFile.SaveFile,
+                descriptions[self.OUTPUT_FILE],
                 fileFilter='PNG files (*.png);;JPEG files (*.jpg);;PDF files (*.pdf)'
             )
         )
@@ -86,7 +121,7 @@ class ExportCanvasWithLegendAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(
             QgsProcessingParameterString(
                 self.LEGEND_POSITION,
-                self.tr('Legend position'),
+                descriptions[self.LEGEND_POSITION],
                 defaultValue='bottom_right'
             )
         )
@@ -94,7 +129,7 @@ class ExportCanvasWithLegendAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(
             QgsProcessingParameterBoolean(
                 self.INCLUDE_FRAME,
-                self.tr('Include frame around legend'),
+                descriptions[self.INCLUDE_FRAME],
                 defaultValue=True
             )
         )
@@ -102,7 +137,7 @@ class ExportCanvasWithLegendAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(
             QgsProcessingParameterString(
                 self.BACKGROUND_COLOR,
-                self.tr('Legend background color'),
+                descriptions[self.BACKGROUND_COLOR],
                 defaultValue='white'
             )
         )
@@ -110,7 +145,7 @@ class ExportCanvasWithLegendAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(
             QgsProcessingParameterString(
                 self.EXPORT_FORMAT,
-                self.tr('Export format'),
+                descriptions[self.EXPORT_FORMAT],
                 defaultValue='PNG'
             )
         )
@@ -119,7 +154,7 @@ class ExportCanvasWithLegendAlgorithm(QgsProcessingAlgorithm):
         """Execute the algorithm"""
         
         try:
-            output_file = self.parameterAsFile(parameters, self.OUTPUT_FILE, context)
+            output_file = self.parameterAsFileOutput(parameters, self.OUTPUT_FILE, context)
             legend_position = self.parameterAsString(parameters, self.LEGEND_POSITION, context)
             include_frame = self.parameterAsBool(parameters, self.INCLUDE_FRAME, context)
             background_color = self.parameterAsString(parameters, self.BACKGROUND_COLOR, context)
@@ -147,6 +182,14 @@ class CreateCompositionWithLegendAlgorithm(QgsProcessingAlgorithm):
     LEGEND_POSITION = 'LEGEND_POSITION'
     PAGE_SIZE = 'PAGE_SIZE'
 
+    PARAMETER_TEXTS = {
+        COMPOSITION_NAME: QT_TRANSLATE_NOOP('Processing', 'Composition name'),
+        INCLUDE_TITLE: QT_TRANSLATE_NOOP('Processing', 'Include title'),
+        TITLE_TEXT: QT_TRANSLATE_NOOP('Processing', 'Title text'),
+        LEGEND_POSITION: QT_TRANSLATE_NOOP('Processing', 'Legend position'),
+        PAGE_SIZE: QT_TRANSLATE_NOOP('Processing', 'Page size')
+    }
+
     def tr(self, string):
         return QCoreApplication.translate('Processing', string)
 
@@ -170,11 +213,12 @@ class CreateCompositionWithLegendAlgorithm(QgsProcessingAlgorithm):
 
     def initAlgorithm(self, config=None):
         """Initialize algorithm parameters"""
+        descriptions = get_parameter_descriptions(self)
         
         self.addParameter(
             QgsProcessingParameterString(
                 self.COMPOSITION_NAME,
-                self.tr('Composition name'),
+                descriptions[self.COMPOSITION_NAME],
                 defaultValue='Canvas with Legend'
             )
         )
@@ -182,7 +226,7 @@ class CreateCompositionWithLegendAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(
             QgsProcessingParameterBoolean(
                 self.INCLUDE_TITLE,
-                self.tr('Include title'),
+                descriptions[self.INCLUDE_TITLE],
                 defaultValue=True
             )
         )
@@ -190,7 +234,7 @@ class CreateCompositionWithLegendAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(
             QgsProcessingParameterString(
                 self.TITLE_TEXT,
-                self.tr('Title text'),
+                descriptions[self.TITLE_TEXT],
                 defaultValue='Map with Legend'
             )
         )
@@ -198,7 +242,7 @@ class CreateCompositionWithLegendAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(
             QgsProcessingParameterString(
                 self.LEGEND_POSITION,
-                self.tr('Legend position'),
+                descriptions[self.LEGEND_POSITION],
                 defaultValue='right'
             )
         )
@@ -206,7 +250,7 @@ class CreateCompositionWithLegendAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(
             QgsProcessingParameterString(
                 self.PAGE_SIZE,
-                self.tr('Page size'),
+                descriptions[self.PAGE_SIZE],
                 defaultValue='A4'
             )
         )
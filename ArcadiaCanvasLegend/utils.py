@@ -9,11 +9,23 @@ from qgis.core import QgsApplication
 from qgis.PyQt.QtCore import QStandardPaths
 
 
+# Parsed settings files keyed by path, stored with the (mtime, size) they were read at
+_CONFIG_CACHE = {}
+
+# Settings path inside the QGIS profile, kept once it has been resolved
+_settings_file_path = None
+
+
 def get_settings_file_path():
     """
     Get the path to the Arcadia Suite settings file
-    Returns the path to arcadia_suite_settings.ini
+    Returns the path to arcadia_suite_settings.ini; the QGIS profile location
+    is resolved once per session, the fallback location is never kept
     """
+    global _settings_file_path
+    if _settings_file_path is not None:
+        return _settings_file_path
+        
     try:
         # Try to get the QGIS user profile directory
         profile_dir = QgsApplication.qgisSettingsDirPath()
@@ -23,6 +35,7 @@ def get_settings_file_path():
         if not os.path.exists(settings_path):
             create_default_settings_file(settings_path)
             
+        _settings_file_path = settings_path
         return settings_path
     except Exception as e:
         print(f"Error getting settings file path: {e}")
@@ -69,6 +82,36 @@ def create_default_settings_file(file_path):
         print(f"Error creating default settings file: {e}")
 
 
+def _read_settings_file(settings_path):
+    """
+    Return the parsed settings file, re-reading it only when it changed on disk
+    
+    Args:
+        settings_path (str): Path to the settings file
+        
+    Returns:
+        configparser.ConfigParser: The parsed configuration
+    """
+    try:
+        stat = os.stat(settings_path)
+    except FileNotFoundError:
+        # File removed during the session, restore the defaults
+        _CONFIG_CACHE.pop(settings_path, None)
+        create_default_settings_file(settings_path)
+        stat = os.stat(settings_path)
+        
+    # Size catches rewrites that land within the same mtime tick
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(settings_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+        
+    config = configparser.ConfigParser()
+    config.read(settings_path, encoding='utf-8')
+    _CONFIG_CACHE[settings_path] = (version, config)
+    return config
+
+
 def get_arcadia_setting(section, key, default_value=''):
     """
     Get a setting value from the Arcadia Suite configuration
@@ -82,9 +125,7 @@ def get_arcadia_setting(section, key, default_value=''):
         str: The configuration value or default_value
     """
     try:
-        settings_path = get_settings_file_path()
-        config = configparser.ConfigParser()
-        config.read(settings_path, encoding='utf-8')
+        config = _read_settings_file(get_settings_file_path())
         
         if config.has_section(section) and config.has_option(section, key):
             return config.get(section, key)
@@ -107,6 +148,9 @@ def set_arcadia_setting(section, key, value):
     """
     try:
         settings_path = get_settings_file_path()
+        if not os.path.exists(settings_path):
+            create_default_settings_file(settings_path)
+            
         config = configparser.ConfigParser()
         config.read(settings_path, encoding='utf-8')
         
@@ -117,6 +161,9 @@ def set_arcadia_setting(section, key, value):
         
         with open(settings_path, 'w', encoding='utf-8') as configfile:
             config.write(configfile)
+        
+        # Force the next read to pick up the new value
+        _CONFIG_CACHE.pop(settings_path, None)
             
     except Exception as e:
         print(f"Error setting Arcadia setting {section}.{key}: {e}")